@@ -1,18 +1,35 @@
 """Packet, Buffer, and Node classes for DTN simulation."""
 
-from collections import deque
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional, Iterator, Callable
-import time
-import uuid
+from dataclasses import InitVar, dataclass, field
+from enum import IntEnum
+from typing import ClassVar, Optional, Iterator, Callable
+import itertools
 
 
-class PacketType(Enum):
-    NORMAL = "normal"
+class PacketType(IntEnum):
+    NORMAL = 0
 
 
-@dataclass
+_packet_counter = itertools.count()
+
+
+class SimClock:
+    """Simulation clock in seconds. Each scenario owns one and advances it from its tick."""
+    
+    __slots__ = ("now",)
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _new_packet_id() -> str:
+    return f"{next(_packet_counter):08x}"
+
+
+@dataclass(slots=True)
 class Packet:
     """Represents a DTN packet with store-and-forward capability."""
     
@@ -20,13 +37,60 @@ class Packet:
     destination: str
     packet_type: PacketType = PacketType.NORMAL
     payload: str = ""
-    packet_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-    created_at: float = field(default_factory=time.time)
+    packet_id: str = field(default_factory=_new_packet_id)
+    created_at: Optional[float] = None
     hops: list[str] = field(default_factory=list)
+    # Clock of the scenario the packet lives in; created_at and age are read
+    # from it. Without one, age is always 0.
+    clock: Optional[SimClock] = field(default=None, repr=False, compare=False)
+    # Set while the packet sits in the pool, so a second release is a no-op.
+    _pooled: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    # Delivered packets are recycled here instead of being freed.
+    _pool: ClassVar[list["Packet"]] = []
+    _POOL_SIZE: ClassVar[int] = 256
+    
+    @classmethod
+    def acquire(
+        cls,
+        source: str,
+        destination: str,
+        packet_type: PacketType = PacketType.NORMAL,
+        payload: str = "",
+        clock: Optional[SimClock] = None,
+    ) -> "Packet":
+        if not cls._pool:
+            return cls(source, destination, packet_type, payload, clock=clock)
+        packet = cls._pool.pop()
+        packet._pooled = False
+        packet.source = source
+        packet.destination = destination
+        packet.packet_type = packet_type
+        packet.payload = payload
+        packet.packet_id = _new_packet_id()
+        packet.clock = clock
+        packet.created_at = clock.now if clock is not None else 0.0
+        packet.hops.clear()
+        return packet
+    
+    @classmethod
+    def release(cls, packet: "Packet") -> None:
+        if packet._pooled:
+            return
+        packet._pooled = True
+        packet.clock = None
+        if len(cls._pool) < cls._POOL_SIZE:
+            cls._pool.append(packet)
+    
+    def __post_init__(self) -> None:
+        if self.created_at is None:
+            self.created_at = self.clock.now if self.clock is not None else 0.0
     
     @property
     def age(self) -> float:
-        return time.time() - self.created_at
+        if self.clock is None:
+            return 0.0
+        return self.clock.now - self.created_at
     
     def add_hop(self, node_id: str) -> None:
         self.hops.append(node_id)
@@ -36,56 +100,68 @@ class Packet:
 
 
 class Buffer:
-    """FIFO buffer for DTN packets."""
+    """Fixed-capacity FIFO ring buffer for DTN packets."""
+    
+    __slots__ = ("max_size", "_slots", "_head", "_count")
     
     def __init__(self, max_size: int = 100):
         self.max_size = max_size
-        self._queue: deque[Packet] = deque()
+        self._slots: list[Optional[Packet]] = [None] * max_size
+        self._head = 0
+        self._count = 0
     
     @property
     def size(self) -> int:
-        return len(self._queue)
+        return self._count
     
     @property
     def is_empty(self) -> bool:
-        return self.size == 0
+        return self._count == 0
     
     @property
     def is_full(self) -> bool:
-        return self.size >= self.max_size
+        return self._count >= self.max_size
     
     def enqueue(self, packet: Packet) -> bool:
-        if self.is_full:
+        if self._count >= self.max_size:
             return False
-        self._queue.append(packet)
+        self._slots[(self._head + self._count) % self.max_size] = packet
+        self._count += 1
         return True
     
     def dequeue(self) -> Optional[Packet]:
-        if self._queue:
-            return self._queue.popleft()
-        return None
+        if not self._count:
+            return None
+        packet = self._slots[self._head]
+        self._slots[self._head] = None
+        self._head = (self._head + 1) % self.max_size
+        self._count -= 1
+        return packet
     
     def peek(self) -> Optional[Packet]:
-        if self._queue:
-            return self._queue[0]
+        if self._count:
+            return self._slots[self._head]
         return None
     
     def clear(self) -> int:
-        count = self.size
-        self._queue.clear()
+        count = self._count
+        self._slots = [None] * self.max_size
+        self._head = 0
+        self._count = 0
         return count
     
     def __iter__(self) -> Iterator[Packet]:
-        yield from self._queue
+        for i in range(self._count):
+            yield self._slots[(self._head + i) % self.max_size]
     
     def __len__(self) -> int:
-        return self.size
+        return self._count
     
     def __repr__(self) -> str:
         return f"Buffer({self.size}/{self.max_size})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """Represents a DTN node with buffering capability."""
     
@@ -93,21 +169,53 @@ class Node:
     name: str
     buffer: Buffer = field(default_factory=Buffer)
     is_online: bool = True
-    _connections: dict[str, bool] = field(default_factory=dict)
+    # Initial {node_id: in_range} connections, loaded into the neighbour lists
+    _connections: InitVar[Optional[dict[str, bool]]] = None
+    # Called with each packet delivered here. The packet is recycled as soon
+    # as the callback returns, so callbacks must not keep a reference to it.
     on_receive: Optional[Callable[[Packet], None]] = None
+    # Nodes only have a handful of neighbours, so parallel lists scanned
+    # linearly beat hashing into a dict.
+    _neighbor_ids: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _neighbor_in_range: list[bool] = field(default_factory=list, init=False, repr=False, compare=False)
+    _connected_cache: Optional[list[str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self, _connections: Optional[dict[str, bool]]) -> None:
+        if _connections:
+            for other_node_id, in_range in _connections.items():
+                self.add_connection(other_node_id, in_range)
     
     def add_connection(self, other_node_id: str, in_range: bool = False) -> None:
-        self._connections[other_node_id] = in_range
+        if other_node_id in self._neighbor_ids:
+            self._neighbor_in_range[self._neighbor_ids.index(other_node_id)] = in_range
+        else:
+            self._neighbor_ids.append(other_node_id)
+            self._neighbor_in_range.append(in_range)
+        self._connected_cache = None
     
     def set_in_range(self, other_node_id: str, in_range: bool) -> None:
-        if other_node_id in self._connections:
-            self._connections[other_node_id] = in_range
+        ids = self._neighbor_ids
+        for i in range(len(ids)):
+            if ids[i] == other_node_id:
+                if self._neighbor_in_range[i] != in_range:
+                    self._neighbor_in_range[i] = in_range
+                    self._connected_cache = None
+                return
     
     def is_in_range(self, other_node_id: str) -> bool:
-        return self._connections.get(other_node_id, False)
+        ids = self._neighbor_ids
+        for i in range(len(ids)):
+            if ids[i] == other_node_id:
+                return self._neighbor_in_range[i]
+        return False
     
     def get_connected_nodes(self) -> list[str]:
-        return [nid for nid, in_range in self._connections.items() if in_range]
+        # The cached list is shared between calls; treat it as read-only.
+        if self._connected_cache is None:
+            self._connected_cache = [
+                nid for nid, in_range in zip(self._neighbor_ids, self._neighbor_in_range) if in_range
+            ]
+        return self._connected_cache
     
     def queue_packet(self, packet: Packet) -> bool:
         if not self.is_online:
@@ -123,6 +231,7 @@ class Node:
         if packet.destination == self.node_id:
             if self.on_receive:
                 self.on_receive(packet)
+            Packet.release(packet)
             return True
         else:
             return self.queue_packet(packet)
@@ -2,215 +2,219 @@
 
 import asyncio
 import random
+from functools import partial
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static, Button, Footer, Header
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
+from textual.widget import Widget
+from textual.geometry import Region
+from textual.strip import Strip
 from textual import work
+from rich.segment import Segment
+from rich.style import Style
 from rich.text import Text
 from rich.panel import Panel
 from rich.table import Table
 
-from src.dtn_core import Node, Packet, PacketType, Buffer
+from src.dtn_core import Node, Packet, Buffer, SimClock
 
 
-class ConvoyView(Static):
-    """A unified view showing vehicles on an animated road."""
+class ConvoyView(Widget):
+    """A unified view showing vehicles on an animated road.
     
-    road_frame: reactive[int] = reactive(0)
-    
-    v1_buffer: reactive[int] = reactive(0)
-    v2_buffer: reactive[int] = reactive(0)
-    v3_buffer: reactive[int] = reactive(0)
-    v3_online: reactive[bool] = reactive(True)
-    
-    v1_receiving: reactive[bool] = reactive(False)
-    v2_receiving: reactive[bool] = reactive(False)
-    v3_receiving: reactive[bool] = reactive(False)
-    cp_receiving: reactive[bool] = reactive(False)
-    
-    v1_v2_connected: reactive[bool] = reactive(True)
-    v2_v3_connected: reactive[bool] = reactive(True)
-    v3_cp_connected: reactive[bool] = reactive(False)
-    
-    transmitting_link: reactive[int] = reactive(-1)
-    transmit_progress: reactive[float] = reactive(0.0)
+    Rendered line by line so that a state change only repaints the rows
+    that show it (e.g. the road animation touches just the two road rows).
+    """
     
-    cp_delivered: reactive[int] = reactive(0)
-    cp_show_ack: reactive[bool] = reactive(False)
+    # Road animation phase, 0-5.
+    road_frame: reactive[int] = reactive(0, repaint=False)
+    
+    v1_buffer: reactive[int] = reactive(0, repaint=False)
+    v2_buffer: reactive[int] = reactive(0, repaint=False)
+    v3_buffer: reactive[int] = reactive(0, repaint=False)
+    v3_online: reactive[bool] = reactive(True, repaint=False)
+    
+    v1_receiving: reactive[bool] = reactive(False, repaint=False)
+    v2_receiving: reactive[bool] = reactive(False, repaint=False)
+    v3_receiving: reactive[bool] = reactive(False, repaint=False)
+    cp_receiving: reactive[bool] = reactive(False, repaint=False)
+    
+    v1_v2_connected: reactive[bool] = reactive(True, repaint=False)
+    v2_v3_connected: reactive[bool] = reactive(True, repaint=False)
+    v3_cp_connected: reactive[bool] = reactive(False, repaint=False)
+    
+    transmitting_link: reactive[int] = reactive(-1, repaint=False)
+    transmit_progress: reactive[float] = reactive(0.0, repaint=False)
+    
+    cp_delivered: reactive[int] = reactive(0, repaint=False)
+    cp_show_ack: reactive[bool] = reactive(False, repaint=False)
+    
+    BOX_W = 13
+    GAP_W = 6
+    HQ_W = 16
+    ROAD_WIDTH = BOX_W * 3 + GAP_W * 3 + HQ_W
+    # Terminal cell width of each status icon (emoji take two cells).
+    ICON_WIDTH = {"📡": 2, "⛔": 2, "✓": 1}
+    
+    ROW_ROAD_TOP, ROW_STATUS, ROW_BOX_TOP, ROW_LINKS, ROW_BOX_BOTTOM, ROW_BUFFERS, ROW_ROAD_BOTTOM = range(7)
+    ROWS = 7
+    
+    # Rows that have to be repainted when each reactive changes.
+    DIRTY_ROWS = {
+        "road_frame": (ROW_ROAD_TOP, ROW_ROAD_BOTTOM),
+        "v1_buffer": (ROW_STATUS, ROW_BUFFERS),
+        "v2_buffer": (ROW_STATUS, ROW_BUFFERS),
+        "v3_buffer": (ROW_STATUS, ROW_BUFFERS),
+        "v3_online": (ROW_STATUS, ROW_BOX_TOP, ROW_LINKS, ROW_BOX_BOTTOM, ROW_BUFFERS),
+        "v1_receiving": (ROW_STATUS,),
+        "v2_receiving": (ROW_STATUS,),
+        "v3_receiving": (ROW_STATUS,),
+        "cp_receiving": (ROW_STATUS,),
+        "cp_show_ack": (ROW_STATUS,),
+        "v1_v2_connected": (ROW_LINKS,),
+        "v2_v3_connected": (ROW_LINKS,),
+        "v3_cp_connected": (ROW_LINKS,),
+        "transmitting_link": (ROW_LINKS,),
+        "transmit_progress": (ROW_LINKS,),
+        "cp_delivered": (ROW_BUFFERS,),
+    }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.width = 95
+        # The road pattern repeats every 6 frames, so build each frame once
+        # by slicing a repeated master pattern.
+        road_base = "═══   " * (self.ROAD_WIDTH // 6 + 2)
+        self._road_lines = [
+            road_base[(6 - offset) % 6:(6 - offset) % 6 + self.ROAD_WIDTH]
+            for offset in range(6)
+        ]
+        self._bars = ["[" + "█" * i + "░" * (6 - i) + "]" for i in range(7)]
+        self._link_frames = [
+            "".join("▓" if abs(i - pos) <= 1 else "░" for i in range(self.GAP_W))
+            for pos in range(self.GAP_W + 1)
+        ]
+        self._link_idle = "──────"
+        self._link_broken = "· · · "
+        
+        # Box borders only change colour when V3 goes offline.
+        self._gap = " " * self.GAP_W
+        self._box_rows = {}
+        for v3_online in (True, False):
+            v3_style = "cyan" if v3_online else "dim red"
+            top = (
+                ("┌───────────┐", "cyan"), (self._gap, None),
+                ("┌───────────┐", "cyan"), (self._gap, None),
+                ("┌───────────┐", v3_style), (self._gap, None),
+                ("┌──────────────┐", "bold yellow"),
+            )
+            bottom = (
+                ("└─────◊─────┘", "cyan"), (self._gap, None),
+                ("└───────────┘", "cyan"), (self._gap, None),
+                ("└─────◊─────┘", v3_style), (self._gap, None),
+                ("└──────────────┘", "bold yellow"),
+            )
+            self._box_rows[v3_online] = (top, bottom)
     
-    def render(self) -> Text:
-        text = Text()
-        
-        v1_style = "cyan"
-        v2_style = "cyan"  
-        v3_style = "dim red" if not self.v3_online else "cyan"
-        hq_style = "bold yellow"
-        
-        box_w = 13
-        gap_w = 6
-        hq_w = 16
-        
-        def center_in(s: str, width: int) -> str:
+    def on_mount(self) -> None:
+        for name, rows in self.DIRTY_ROWS.items():
+            self.watch(self, name, partial(self._refresh_rows, rows), init=False)
+    
+    def _top_row(self) -> int:
+        return max((self.size.height - self.ROWS) // 2, 0)
+    
+    def _refresh_rows(self, rows) -> None:
+        top = self._top_row()
+        width = self.size.width
+        self.refresh(*(Region(0, top + row, width, 1) for row in rows))
+    
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        row = y - self._top_row()
+        if not 0 <= row < self.ROWS:
+            return Strip.blank(width, self.rich_style)
+        
+        left = max((width - self.ROAD_WIDTH) // 2, 0)
+        segments = [Segment(" " * left)]
+        for text, style in self._row_segments(row):
+            segments.append(Segment(text, Style.parse(style) if style else None))
+        return Strip(segments).apply_style(self.rich_style)
+    
+    @staticmethod
+    def _center_in(s: str, width: int, visual_len: int | None = None) -> str:
+        if visual_len is None:
             visual_len = len(s)
-            for c in s:
-                if ord(c) > 0x1F000:
-                    visual_len += 1
-            pad_total = width - visual_len
-            pad_left = pad_total // 2
-            pad_right = pad_total - pad_left
-            return " " * pad_left + s + " " * pad_right
-        
-        offset = self.road_frame % 6
-        road_line = ""
-        road_width = box_w * 3 + gap_w * 3 + hq_w
-        for i in range(road_width):
-            if (i - offset) % 6 < 3:
-                road_line += "═"
-            else:
-                road_line += " "
-        text.append(road_line, style="white bold")
-        text.append("\n")
-        
-        v1_icon = "📡" if self.v1_receiving else "✓"
-        v2_icon = "📡" if self.v2_receiving else "✓"
-        v3_icon = "⛔" if not self.v3_online else ("📡" if self.v3_receiving else "✓")
-        hq_s = "✓" if self.cp_show_ack else " "
-        
-        v1_s = f"{v1_icon} B:{self.v1_buffer}"
-        v2_s = f"{v2_icon} B:{self.v2_buffer}"
-        v3_s = f"{v3_icon} B:{self.v3_buffer}"
-        
-        status_line = Text()
-        status_line.append(center_in(v1_s, box_w), style="green")
-        status_line.append(" " * gap_w)
-        status_line.append(center_in(v2_s, box_w), style="green")
-        status_line.append(" " * gap_w)
-        status_line.append(center_in(v3_s, box_w), style="green" if self.v3_online else "red")
-        status_line.append(" " * gap_w)
-        status_line.append(center_in(hq_s, hq_w), style="green")
-        status_line.append("\n")
-        text.append_text(status_line)
-        
-        row1 = Text()
-        row1.append("┌───────────┐", style=v1_style)
-        row1.append(" " * gap_w)
-        row1.append("┌───────────┐", style=v2_style)
-        row1.append(" " * gap_w)
-        row1.append("┌───────────┐", style=v3_style)
-        row1.append(" " * gap_w)
-        row1.append("┌──────────────┐", style=hq_style)
-        row1.append("\n")
-        text.append_text(row1)
-        
-        row2 = Text()
-        row2.append("│  V1 LEAD  │", style=v1_style)
-        
-        if self.transmitting_link == 0:
-            link_len = gap_w
-            packet_pos = int(self.transmit_progress * link_len)
-            link_str = ""
-            for i in range(link_len):
-                if abs(i - packet_pos) <= 1:
-                    link_str += "▓"
-                else:
-                    link_str += "░"
-            row2.append(link_str, style="bold green")
-        elif self.v1_v2_connected:
-            row2.append("──────", style="dim green")
-        else:
-            row2.append("· · · ", style="dim red")
-        
-        row2.append("│ V2 CARGO  │", style=v2_style)
-        
-        if self.transmitting_link == 1:
-            link_len = gap_w
-            packet_pos = int(self.transmit_progress * link_len)
-            link_str = ""
-            for i in range(link_len):
-                if abs(i - packet_pos) <= 1:
-                    link_str += "▓"
-                else:
-                    link_str += "░"
-            row2.append(link_str, style="bold green")
-        elif self.v2_v3_connected:
-            row2.append("──────", style="dim green")
-        else:
-            row2.append("· · · ", style="dim red")
-        
-        row2.append("│ V3 COMMS  │", style=v3_style)
-        
-        if self.transmitting_link == 2:
-            link_len = gap_w
-            packet_pos = int(self.transmit_progress * link_len)
-            link_str = ""
-            for i in range(link_len):
-                if abs(i - packet_pos) <= 1:
-                    link_str += "▓"
-                else:
-                    link_str += "░"
-            row2.append(link_str, style="bold green")
-        elif self.v3_cp_connected:
-            row2.append("──────", style="dim green")
-        else:
-            row2.append("· · · ", style="dim red")
-        
-        row2.append("│ HEAD QUARTER │", style=hq_style)
-        row2.append("\n")
-        text.append_text(row2)
+        pad_total = width - visual_len
+        pad_left = pad_total // 2
+        pad_right = pad_total - pad_left
+        return " " * pad_left + s + " " * pad_right
+    
+    def _row_segments(self, row: int):
+        box_w = self.BOX_W
+        hq_w = self.HQ_W
+        gap = self._gap
+        center_in = self._center_in
+        
+        if row == self.ROW_ROAD_TOP or row == self.ROW_ROAD_BOTTOM:
+            return ((self._road_lines[self.road_frame], "white bold"),)
+        
+        if row == self.ROW_BOX_TOP:
+            return self._box_rows[self.v3_online][0]
+        
+        if row == self.ROW_BOX_BOTTOM:
+            return self._box_rows[self.v3_online][1]
+        
+        if row == self.ROW_STATUS:
+            v1_icon = "📡" if self.v1_receiving else "✓"
+            v2_icon = "📡" if self.v2_receiving else "✓"
+            v3_icon = "⛔" if not self.v3_online else ("📡" if self.v3_receiving else "✓")
+            hq_s = "✓" if self.cp_show_ack else " "
+            
+            v1_s = f"{v1_icon} B:{self.v1_buffer}"
+            v2_s = f"{v2_icon} B:{self.v2_buffer}"
+            v3_s = f"{v3_icon} B:{self.v3_buffer}"
+            
+            icon_width = self.ICON_WIDTH
+            v3_status_style = "green" if self.v3_online else "red"
+            return (
+                (center_in(v1_s, box_w, len(v1_s) - 1 + icon_width[v1_icon]), "green"), (gap, None),
+                (center_in(v2_s, box_w, len(v2_s) - 1 + icon_width[v2_icon]), "green"), (gap, None),
+                (center_in(v3_s, box_w, len(v3_s) - 1 + icon_width[v3_icon]), v3_status_style), (gap, None),
+                (center_in(hq_s, hq_w), "green"),
+            )
         
-        row3 = Text()
-        row3.append("└─────◊─────┘", style=v1_style)
-        row3.append(" " * gap_w)
-        row3.append("└───────────┘", style=v2_style)
-        row3.append(" " * gap_w)
-        row3.append("└─────◊─────┘", style=v3_style)
-        row3.append(" " * gap_w)
-        row3.append("└──────────────┘", style=hq_style)
-        row3.append("\n")
-        text.append_text(row3)
+        if row == self.ROW_LINKS:
+            v3_style = "dim red" if not self.v3_online else "cyan"
+            return (
+                ("│  V1 LEAD  │", "cyan"), self._render_link(0, self.v1_v2_connected),
+                ("│ V2 CARGO  │", "cyan"), self._render_link(1, self.v2_v3_connected),
+                ("│ V3 COMMS  │", v3_style), self._render_link(2, self.v3_cp_connected),
+                ("│ HEAD QUARTER │", "bold yellow"),
+            )
         
-        buff_row = Text()
-        v1_b = f"[{self._make_buffer_bar(self.v1_buffer)}]"
-        v2_b = f"[{self._make_buffer_bar(self.v2_buffer)}]"
-        v3_b = f"[{self._make_buffer_bar(self.v3_buffer)}]"
+        v1_b = self._make_buffer_bar(self.v1_buffer)
+        v2_b = self._make_buffer_bar(self.v2_buffer)
+        v3_b = self._make_buffer_bar(self.v3_buffer)
         hq_delivered = f"✓ {self.cp_delivered}"
-        
-        buff_row.append(center_in(v1_b, box_w), style=self._buffer_color(self.v1_buffer))
-        buff_row.append(" " * gap_w)
-        buff_row.append(center_in(v2_b, box_w), style=self._buffer_color(self.v2_buffer))
-        buff_row.append(" " * gap_w)
-        buff_row.append(center_in(v3_b, box_w), style=self._buffer_color(self.v3_buffer) if self.v3_online else "red")
-        buff_row.append(" " * gap_w)
-        buff_row.append(center_in(hq_delivered, hq_w), style="bold green")
-        buff_row.append("\n")
-        text.append_text(buff_row)
-        
-
-        
-        offset = self.road_frame % 6
-        road_line = ""
-        road_width = box_w * 3 + gap_w * 3 + hq_w
-        for i in range(road_width):
-            if (i - offset) % 6 < 3:
-                road_line += "═"
-            else:
-                road_line += " "
-        
-        text.append(road_line, style="white bold")
-        text.append("\n")
-        
-        return text
+        v3_b_style = self._buffer_color(self.v3_buffer) if self.v3_online else "red"
+        return (
+            (center_in(v1_b, box_w), self._buffer_color(self.v1_buffer)), (gap, None),
+            (center_in(v2_b, box_w), self._buffer_color(self.v2_buffer)), (gap, None),
+            (center_in(v3_b, box_w), v3_b_style), (gap, None),
+            (center_in(hq_delivered, hq_w), "bold green"),
+        )
+    
+    def _render_link(self, link_index, connected):
+        if self.transmitting_link == link_index:
+            packet_pos = min(int(self.transmit_progress * self.GAP_W), self.GAP_W)
+            return self._link_frames[packet_pos], "bold green"
+        if connected:
+            return self._link_idle, "dim green"
+        return self._link_broken, "dim red"
     
     def _make_buffer_bar(self, count):
-        bar_len = 6
-        filled = min(count, bar_len)
-        return "█" * filled + "░" * (bar_len - filled)
+        return self._bars[min(count, 6)]
     
     def _buffer_color(self, count):
         if count < 3:
@@ -249,8 +253,6 @@ class MilitaryScenario(Screen):
         border: solid $primary;
         padding: 0 1;
         margin-bottom: 1;
-        content-align: center middle;
-        text-align: center;
     }
     
     #status-panel {
@@ -282,6 +284,10 @@ class MilitaryScenario(Screen):
     
     """
     
+    # A link is only 6 cells wide, so 20 steps over ~3s is as smooth as 100.
+    TRANSFER_STEPS = 20
+    TRANSFER_STEP_DELAY = 0.15
+    
     is_paused: reactive[bool] = reactive(False)
     v3_online: reactive[bool] = reactive(True)
     packets_created: reactive[int] = reactive(0)
@@ -290,8 +296,13 @@ class MilitaryScenario(Screen):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._setup_network()
+        # Simulated time of this scenario only; it stops while paused.
+        self.clock = SimClock()
         self._road_frame = 0
         self._transfer_in_progress = False
+        self._last_status_key = None
+        # Bundles held in vehicle buffers, kept in step with every enqueue/dequeue.
+        self._total_buffered = 0
         
         self._range_states = {
             "v1_v2": True,
@@ -303,6 +314,7 @@ class MilitaryScenario(Screen):
             "v2_v3": 0,
             "v3_cp": 0,
         }
+        self._v3_cp_threshold = random.randint(40, 60)
     
     def _setup_network(self) -> None:
         self.vehicles = {
@@ -334,7 +346,10 @@ class MilitaryScenario(Screen):
         yield Footer()
     
     def on_mount(self) -> None:
-        self._update_display()
+        self._convoy_view = self.query_one("#convoy-view", ConvoyView)
+        self._status_panel = self.query_one("#status-panel", Static)
+        self._toggle_btn = self.query_one("#toggle-btn", Button)
+        self._render_all()
         self.run_simulation()
     
     @work(exclusive=True)
@@ -345,17 +360,15 @@ class MilitaryScenario(Screen):
             await asyncio.sleep(0.1)
     
     async def _simulation_tick(self) -> None:
-        self._road_frame += 1
-        try:
-            convoy = self.query_one("#convoy-view", ConvoyView)
-            convoy.road_frame = self._road_frame
-        except Exception:
-            pass
-        
-        self._update_range_states()
-        self._update_convoy_view()
-        self._process_forwarding()
-        self._update_display()
+        # The road pattern has a period of 6, so only the phase is tracked.
+        self._road_frame = (self._road_frame + 1) % 6
+        self.clock.advance(0.1)
+        with self.app.batch_update():
+            self._convoy_view.road_frame = self._road_frame
+            
+            self._update_range_states()
+            self._process_forwarding()
+            self._render_all()
     
     def _update_range_states(self) -> None:
         self._range_states["v1_v2"] = True
@@ -367,26 +380,13 @@ class MilitaryScenario(Screen):
         
         self._range_timers["v3_cp"] += 1
         if self.v3_online:
-            if self._range_timers["v3_cp"] > random.randint(40, 60):
+            if self._range_timers["v3_cp"] > self._v3_cp_threshold:
                 self._range_states["v3_cp"] = not self._range_states["v3_cp"]
                 self._range_timers["v3_cp"] = 0
+                self._v3_cp_threshold = random.randint(40, 60)
         else:
             self._range_states["v3_cp"] = False
     
-    def _update_convoy_view(self) -> None:
-        try:
-            convoy = self.query_one("#convoy-view", ConvoyView)
-            convoy.v1_buffer = self.vehicles["V1"].buffer_size
-            convoy.v2_buffer = self.vehicles["V2"].buffer_size
-            convoy.v3_buffer = self.vehicles["V3"].buffer_size
-            convoy.v3_online = self.v3_online
-            convoy.v1_v2_connected = self._range_states["v1_v2"]
-            convoy.v2_v3_connected = self._range_states["v2_v3"]
-            convoy.v3_cp_connected = self._range_states["v3_cp"]
-            convoy.cp_delivered = self.packets_delivered
-        except Exception:
-            pass
-    
     def _process_forwarding(self) -> None:
         if self._transfer_in_progress:
             return
@@ -402,34 +402,38 @@ class MilitaryScenario(Screen):
         packet = self.vehicles[from_id].get_next_packet()
         if not packet:
             return
+        self._total_buffered -= 1
         
         self._transfer_in_progress = True
         self._do_transfer_animation(packet, from_id, to_id, link_index)
     
     @work(exclusive=False)
     async def _do_transfer_animation(self, packet, from_id: str, to_id: str, link_index: int) -> None:
+        convoy = self._convoy_view
         try:
-            convoy = self.query_one("#convoy-view", ConvoyView)
-            convoy.transmitting_link = link_index
+            with self.app.batch_update():
+                convoy.transmitting_link = link_index
+                
+                if to_id == "V2":
+                    convoy.v2_receiving = True
+                elif to_id == "V3":
+                    convoy.v3_receiving = True
             
-            if to_id == "V2":
-                convoy.v2_receiving = True
-            elif to_id == "V3":
-                convoy.v3_receiving = True
+            for step in range(self.TRANSFER_STEPS + 1):
+                convoy.transmit_progress = step / self.TRANSFER_STEPS
+                await asyncio.sleep(self.TRANSFER_STEP_DELAY)
             
-            for progress in range(0, 101, 1):
-                convoy.transmit_progress = progress / 100.0
-                await asyncio.sleep(0.03)
+            with self.app.batch_update():
+                convoy.transmitting_link = -1
+                convoy.transmit_progress = 0.0
+                convoy.v2_receiving = False
+                convoy.v3_receiving = False
             
-            convoy.transmitting_link = -1
-            convoy.transmit_progress = 0.0
-            convoy.v2_receiving = False
-            convoy.v3_receiving = False
-            
-            self.vehicles[to_id].queue_packet(packet)
-            self._update_convoy_view()
-        except Exception:
-            pass
+            if self.vehicles[to_id].queue_packet(packet):
+                self._total_buffered += 1
+            else:
+                Packet.release(packet)
+            self._render_all()
         finally:
             self._transfer_in_progress = False
     
@@ -437,98 +441,121 @@ class MilitaryScenario(Screen):
         packet = self.vehicles["V3"].get_next_packet()
         if not packet:
             return
+        self._total_buffered -= 1
         
         self._transfer_in_progress = True
         self._do_hq_delivery_animation(packet)
     
     @work(exclusive=False)
     async def _do_hq_delivery_animation(self, packet) -> None:
+        convoy = self._convoy_view
         try:
-            convoy = self.query_one("#convoy-view", ConvoyView)
-            convoy.transmitting_link = 2
-            convoy.cp_receiving = True
+            with self.app.batch_update():
+                convoy.transmitting_link = 2
+                convoy.cp_receiving = True
             
-            for progress in range(0, 101, 1):
-                convoy.transmit_progress = progress / 100.0
-                await asyncio.sleep(0.03)
-            
-            convoy.transmitting_link = -1
-            convoy.transmit_progress = 0.0
-            convoy.cp_receiving = False
+            for step in range(self.TRANSFER_STEPS + 1):
+                convoy.transmit_progress = step / self.TRANSFER_STEPS
+                await asyncio.sleep(self.TRANSFER_STEP_DELAY)
             
             self.packets_delivered += 1
-            convoy.cp_delivered = self.packets_delivered
-            convoy.cp_show_ack = True
+            Packet.release(packet)
+            with self.app.batch_update():
+                convoy.transmitting_link = -1
+                convoy.transmit_progress = 0.0
+                convoy.cp_receiving = False
+                convoy.cp_delivered = self.packets_delivered
+                convoy.cp_show_ack = True
             await asyncio.sleep(0.3)
             convoy.cp_show_ack = False
-            self._update_convoy_view()
-        except Exception:
-            pass
+            self._render_all()
         finally:
             self._transfer_in_progress = False
     
-    def _update_display(self) -> None:
-        self._update_convoy_view()
+    def _render_all(self) -> None:
+        v1_buffer = self.vehicles["V1"].buffer_size
+        v2_buffer = self.vehicles["V2"].buffer_size
+        v3_buffer = self.vehicles["V3"].buffer_size
+        v1_v2 = self._range_states["v1_v2"]
+        v2_v3 = self._range_states["v2_v3"]
+        v3_cp = self._range_states["v3_cp"]
+        v3_online = self.v3_online
+        packets_created = self.packets_created
+        packets_delivered = self.packets_delivered
+        is_paused = self.is_paused
+        total_buffer = self._total_buffered
+        
+        convoy = self._convoy_view
+        with self.app.batch_update():
+            convoy.v1_buffer = v1_buffer
+            convoy.v2_buffer = v2_buffer
+            convoy.v3_buffer = v3_buffer
+            convoy.v3_online = v3_online
+            convoy.v1_v2_connected = v1_v2
+            convoy.v2_v3_connected = v2_v3
+            convoy.v3_cp_connected = v3_cp
+            convoy.cp_delivered = packets_delivered
+        
+        key = (v1_v2, v2_v3, v3_cp, v3_online, packets_created, packets_delivered, is_paused, total_buffer)
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
         
-        try:
-            status = self.query_one("#status-panel", Static)
-            
-            table = Table.grid(padding=(0, 2))
-            table.add_column(justify="left")
-            table.add_column(justify="center")
-            table.add_column(justify="center")
-            table.add_column(justify="right")
-            
-            c1 = "🟢" if self._range_states["v1_v2"] else "🔴"
-            c2 = "🟢" if self._range_states["v2_v3"] else "🔴"
-            c3 = "🟢" if self._range_states["v3_cp"] else "🔴"
-            
-            v3_status = "🟢 ONLINE" if self.v3_online else "🔴 OFFLINE"
-            
-            table.add_row(
-                Text(f"V1↔V2: {c1}", style="white"),
-                Text(f"V2↔V3: {c2}", style="white"),
-                Text(f"V3↔HQ: {c3}", style="white"),
-                Text(f"V3 Status: {v3_status}", style="bold"),
-            )
-            
-            total_buffer = sum(v.buffer_size for v in self.vehicles.values())
-            state = "PAUSED" if self.is_paused else "RUNNING"
-            
-            table.add_row(
-                Text(f"Bundles Created: {self.packets_created}", style="cyan"),
-                Text(f"Total Buffered: {total_buffer}", style="yellow"),
-                Text(f"Delivered: {self.packets_delivered}", style="green bold"),
-                Text(f"State: {state}", style="magenta"),
-            )
-            
-            status.update(Panel(table, title="Convoy Status", border_style="blue"))
-        except Exception:
-            pass
+        status = self._status_panel
+        
+        table = Table.grid(padding=(0, 2))
+        table.add_column(justify="left")
+        table.add_column(justify="center")
+        table.add_column(justify="center")
+        table.add_column(justify="right")
+        
+        c1 = "🟢" if v1_v2 else "🔴"
+        c2 = "🟢" if v2_v3 else "🔴"
+        c3 = "🟢" if v3_cp else "🔴"
+        
+        v3_status = "🟢 ONLINE" if v3_online else "🔴 OFFLINE"
+        
+        table.add_row(
+            Text(f"V1↔V2: {c1}", style="white"),
+            Text(f"V2↔V3: {c2}", style="white"),
+            Text(f"V3↔HQ: {c3}", style="white"),
+            Text(f"V3 Status: {v3_status}", style="bold"),
+        )
+        
+        state = "PAUSED" if is_paused else "RUNNING"
+        
+        table.add_row(
+            Text(f"Bundles Created: {packets_created}", style="cyan"),
+            Text(f"Total Buffered: {total_buffer}", style="yellow"),
+            Text(f"Delivered: {packets_delivered}", style="green bold"),
+            Text(f"State: {state}", style="magenta"),
+        )
+        
+        status.update(Panel(table, title="Convoy Status", border_style="blue"))
         
 
     
 
     
     def action_send_packet(self) -> None:
-        packet = Packet("V1", "HQ", PacketType.NORMAL, f"Data-{self.packets_created}")
-        self.vehicles["V1"].queue_packet(packet)
+        packet = Packet.acquire("V1", "HQ", payload=f"Data-{self.packets_created}", clock=self.clock)
+        if self.vehicles["V1"].queue_packet(packet):
+            self._total_buffered += 1
+        else:
+            Packet.release(packet)
         self.packets_created += 1
-        self._update_convoy_view()
+        self._render_all()
     
     def action_toggle_v3(self) -> None:
         self.v3_online = not self.v3_online
         self.vehicles["V3"].set_online(self.v3_online)
         
-        try:
-            btn = self.query_one("#toggle-btn", Button)
-            if self.v3_online:
-                btn.label = "V3 Jamming: OFF"
-            else:
-                btn.label = "V3 Jamming: ON"
-            btn.refresh()
-        except Exception:
-            pass
+        btn = self._toggle_btn
+        if self.v3_online:
+            btn.label = "V3 Jamming: OFF"
+        else:
+            btn.label = "V3 Jamming: ON"
+        btn.refresh()
         
         if self.v3_online:
             pass
@@ -536,8 +563,7 @@ class MilitaryScenario(Screen):
             self._range_states["v2_v3"] = False
             self._range_states["v3_cp"] = False
         
-        self._update_convoy_view()
-        self._update_display()
+        self._render_all()
     
     def action_toggle_pause(self) -> None:
         self.is_paused = not self.is_paused
@@ -2,298 +2,401 @@
 
 import asyncio
 import math
+import re
+import time
+from functools import lru_cache
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static, Button, Footer, Header
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
 from textual import work
-from rich.text import Text
+from rich.text import Span, Text
 from rich.panel import Panel
 from rich.table import Table
 
-from src.dtn_core import Node, Packet, PacketType, Buffer
+from src.dtn_core import Node, Packet, Buffer, SimClock
+
+
+# Style tags written alongside each canvas cell; render() looks them up in
+# STYLE_TABLE instead of re-parsing the characters it drew.
+(
+    TAG_PLAIN,
+    TAG_MARS,
+    TAG_MOON,
+    TAG_EARTH,
+    TAG_SAT_LABEL,
+    TAG_SAT,
+    TAG_SAT_BUSY,
+    TAG_MALICIOUS,
+    TAG_BUFFER_BRACKET,
+    TAG_BUFFER_COUNT,
+    TAG_DOT,
+    TAG_RIM,
+    TAG_LINK,
+    TAG_BEAM,
+    TAG_PACKET,
+) = range(15)
+
+STYLE_TABLE: list[str | None] = [
+    None,
+    "bold red",
+    "bold white",
+    "bold cyan",
+    "bold yellow",
+    "bold green",
+    "bold green blink",
+    "bold red blink",
+    "magenta",
+    "bold magenta",
+    "dim red",
+    "dim white",
+    "dim cyan",
+    "dim blue",
+    "bold green",
+]
+
+# Same table with the Earth label flagged while the antenna is down.
+STYLE_TABLE_ANTENNA_OFF = STYLE_TABLE.copy()
+STYLE_TABLE_ANTENNA_OFF[TAG_EARTH] = "bold red"
+
+PLANET_TAGS = {"MARS": TAG_MARS, "MOON": TAG_MOON, "EARTH": TAG_EARTH}
+
+# Tags are kept in a bytearray so runs of one non-plain tag can be found by
+# the regex engine instead of comparing cells one by one in Python.
+_TAG_RUN = re.compile(rb"([^\x00])\1*")
+
+BEAM_IDLE = 0xFF
+
+# Endpoints of each link as indices into the point tuple render() builds:
+# Mars, MA-SAT, MO-SAT1, MO-SAT2, E-SAT, Earth.
+LINK_CONNECTIONS = ((0, 1), (1, 2), (1, 3), (2, 4), (3, 4), (4, 5))
+
+# One full turn split into steps about as fine as the 0.002 rad the orbit
+# advances per tick, so satellites look up their angle instead of calling trig.
+TRIG_STEPS = 3142
+_TRIG_SCALE = TRIG_STEPS / (2 * math.pi)
+_COS = [math.cos(i / _TRIG_SCALE) for i in range(TRIG_STEPS)]
+_SIN = [math.sin(i / _TRIG_SCALE) for i in range(TRIG_STEPS)]
+
+
+def _cs(phase: float, phase_mul: float, offset: float = 0.0) -> tuple[float, float]:
+    """(cos, sin) of phase * phase_mul + offset, read from the lookup tables."""
+    index = int((phase * phase_mul + offset) * _TRIG_SCALE) % TRIG_STEPS
+    return _COS[index], _SIN[index]
+
+
+def _visibility_mask(phase: float) -> int:
+    """Line-of-sight of the six links at an orbit phase, bit i set = link i visible."""
+    mars_sat_cos = _cs(phase, 1.5)[0]
+    moon_sat1_cos = _cs(phase, 2.0)[0]
+    moon_sat2_cos = _cs(phase, 2.0, math.pi)[0]
+    earth_sat_cos = _cs(phase, 1.8, 0.5)[0]
+    
+    mars_sat_facing_moon = mars_sat_cos > 0.3
+    moon_sat1_facing_mars = moon_sat1_cos < -0.2
+    moon_sat2_facing_mars = moon_sat2_cos < -0.2
+    moon_sat1_facing_earth = moon_sat1_cos > 0.3
+    moon_sat2_facing_earth = moon_sat2_cos > 0.3
+    earth_sat_facing_moon = earth_sat_cos < -0.2
+    
+    return (
+        (mars_sat_cos > 0.2)
+        | (mars_sat_facing_moon and moon_sat1_facing_mars) << 1
+        | (mars_sat_facing_moon and moon_sat2_facing_mars) << 2
+        | (moon_sat1_facing_earth and earth_sat_facing_moon) << 3
+        | (moon_sat2_facing_earth and earth_sat_facing_moon) << 4
+        | (earth_sat_cos < 0.2) << 5
+    )
+
+
+@lru_cache(maxsize=None)
+def _planet_positions(width: int, height: int) -> tuple[tuple[int, int], ...]:
+    """Centres of Mars, the Moon and Earth, spread evenly across the canvas."""
+    center_y = height // 2
+    margin = 15  # Margin from edges
+    usable_width = width - 2 * margin
+    spacing = usable_width // 2
+    return (
+        (margin + 0, center_y),
+        (margin + spacing, center_y),
+        (margin + 2 * spacing, center_y),
+    )
+
+
+def _satellite_positions(phase: float, width: int, height: int) -> tuple[tuple[int, int], ...]:
+    """Cells of (MA-SAT, MO-SAT1, MO-SAT2, E-SAT) at an orbit phase."""
+    mars_pos, moon_pos, earth_pos = _planet_positions(width, height)
+    
+    cos_a, sin_a = _cs(phase, 1.5)
+    mars_sat = (int(mars_pos[0] + 10 * cos_a), int(mars_pos[1] + 5 * sin_a))
+    
+    cos_a, sin_a = _cs(phase, 2.0)
+    moon_sat1 = (int(moon_pos[0] + 8 * cos_a), int(moon_pos[1] + 4 * sin_a))
+    
+    cos_a, sin_a = _cs(phase, 2.0, math.pi)
+    moon_sat2 = (int(moon_pos[0] + 8 * cos_a), int(moon_pos[1] + 4 * sin_a))
+    
+    # Earth satellite - orbits Earth
+    cos_a, sin_a = _cs(phase, 1.8, 0.5)
+    earth_sat = (int(earth_pos[0] + 10 * cos_a), int(earth_pos[1] + 5 * sin_a))
+    
+    return mars_sat, moon_sat1, moon_sat2, earth_sat
+
+
+@lru_cache(maxsize=None)
+def _disk_cells(radius: int) -> tuple[tuple[int, int, bool], ...]:
+    """(dx, dy, is_rim) for every cell of a planet disk, cells being twice as tall as wide."""
+    cells = []
+    r2 = radius * radius
+    rim2 = (radius - 0.8) ** 2
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius * 2, radius * 2 + 1):
+            dist2 = (dx / 2) ** 2 + dy * dy
+            if dist2 <= r2:
+                cells.append((dx, dy, dist2 > rim2))
+    return tuple(cells)
+
+
+@lru_cache(maxsize=None)
+def _orbit_offsets(rx: int, ry: int) -> tuple[tuple[float, float], ...]:
+    """Offsets of the dots of an orbit path, one every 5 degrees."""
+    return tuple(
+        (rx * math.cos(math.radians(angle)), ry * math.sin(math.radians(angle)))
+        for angle in range(0, 360, 5)
+    )
+
+
+@lru_cache(maxsize=2048)
+def _line_cells(
+    x1: int, y1: int, x2: int, y2: int, stride: int, width: int, height: int
+) -> tuple[tuple[int, int], ...]:
+    """(step, canvas index) for every on-canvas cell of a line, sampling every stride-th step."""
+    steps = max(abs(x2 - x1), abs(y2 - y1))
+    if steps == 0:
+        return ()
+    cells = []
+    for i in range(0, steps + 1, stride):
+        t = i / steps
+        x = int(x1 + t * (x2 - x1))
+        y = int(y1 + t * (y2 - y1))
+        if 0 <= x < width and 0 <= y < height:
+            cells.append((i, y * width + x))
+    return tuple(cells)
 
 
 class OrbitalView(Static):
     """A 2D canvas showing celestial bodies with orbiting satellites."""
     
-    orbit_phase: reactive[float] = reactive(0.0)
-    transmitting_link: reactive[int] = reactive(-1)
-    transmit_progress: reactive[float] = reactive(0.0)
+    # Changes only mark the canvas dirty; it is redrawn at most this often
+    # however many writes land in between.
+    FRAME_INTERVAL = 1 / 30
     
-    link0_visible: reactive[bool] = reactive(True)
-    link1_visible: reactive[bool] = reactive(False)
-    link2_visible: reactive[bool] = reactive(False)
-    link3_visible: reactive[bool] = reactive(False)
-    link4_visible: reactive[bool] = reactive(False)
-    link5_visible: reactive[bool] = reactive(True)
+    # Beam progress in percent for each link, BEAM_IDLE where no bundle is in flight
+    beam_progress: reactive[bytes] = reactive(bytes([BEAM_IDLE] * 6), repaint=False)
     
-    mars_sat_buffer: reactive[int] = reactive(0)
-    moon_sat1_buffer: reactive[int] = reactive(0)
-    moon_sat2_buffer: reactive[int] = reactive(0)
-    earth_sat_buffer: reactive[int] = reactive(0)
+    # Bit i set = link i visible
+    link_mask: reactive[int] = reactive(0b100001, repaint=False)
     
-    moon_sat1_is_blackhole: reactive[bool] = reactive(False)
-    earth_antenna_off: reactive[bool] = reactive(False)
+    # Cells of (MA-SAT, MO-SAT1, MO-SAT2, E-SAT), computed by the scenario each tick
+    sat_positions: reactive[tuple[tuple[int, int], ...]] = reactive(((0, 0),) * 4, repaint=False)
     
-    _sat_positions: list[tuple[int, int]] = []
+    # Buffered bundles on (MA-SAT, MO-SAT1, MO-SAT2, E-SAT)
+    sat_buffers: reactive[tuple[int, int, int, int]] = reactive((0, 0, 0, 0), repaint=False)
+    
+    moon_sat1_is_blackhole: reactive[bool] = reactive(False, repaint=False)
+    earth_antenna_off: reactive[bool] = reactive(False, repaint=False)
+    
+    DRAWN_REACTIVES = (
+        "beam_progress",
+        "link_mask",
+        "sat_positions",
+        "sat_buffers",
+        "moon_sat1_is_blackhole",
+        "earth_antenna_off",
+    )
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.width = 100
         self.height = 20
+        self._base_chars: list[str] | None = None
+        self._base_tags: bytearray | None = None
+        self._chars: list[str] = []
+        self._tags = bytearray()
+        self.set_reactive(OrbitalView.sat_positions, _satellite_positions(0.0, self.width, self.height))
+        self._dirty = True
+        self._text: Text | None = None
+    
+    def on_mount(self) -> None:
+        for name in self.DRAWN_REACTIVES:
+            self.watch(self, name, self._mark_dirty, init=False)
+        self.auto_refresh = self.FRAME_INTERVAL
+    
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+    
+    def automatic_refresh(self) -> None:
+        if self._dirty:
+            super().automatic_refresh()
     
     def render(self) -> Text:
-        canvas = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-        
-        # Center the three planets evenly across the canvas
-        center_y = self.height // 2
-        margin = 15  # Margin from edges
-        usable_width = self.width - 2 * margin
-        spacing = usable_width // 2
-        
-        mars_pos = (margin + 0, center_y)
-        moon_pos = (margin + spacing, center_y)
-        earth_pos = (margin + 2 * spacing, center_y)
-        
-        self._draw_planet(canvas, mars_pos[0], mars_pos[1], "MARS", "M", 3, 5)
-        self._draw_planet(canvas, moon_pos[0], moon_pos[1], "MOON", "L", 2, 4)
-        self._draw_planet(canvas, earth_pos[0], earth_pos[1], "EARTH", "E", 3, 5)
-        
-        mars_sat_angle = self.orbit_phase * 1.5
-        mars_sat_x = int(mars_pos[0] + 10 * math.cos(mars_sat_angle))
-        mars_sat_y = int(mars_pos[1] + 5 * math.sin(mars_sat_angle))
-        
-        moon_sat1_angle = self.orbit_phase * 2.0
-        moon_sat1_x = int(moon_pos[0] + 8 * math.cos(moon_sat1_angle))
-        moon_sat1_y = int(moon_pos[1] + 4 * math.sin(moon_sat1_angle))
-        
-        moon_sat2_angle = self.orbit_phase * 2.0 + math.pi
-        moon_sat2_x = int(moon_pos[0] + 8 * math.cos(moon_sat2_angle))
-        moon_sat2_y = int(moon_pos[1] + 4 * math.sin(moon_sat2_angle))
-        
-        # Earth satellite - orbits Earth
-        earth_sat_angle = self.orbit_phase * 1.8 + 0.5
-        earth_sat_x = int(earth_pos[0] + 10 * math.cos(earth_sat_angle))
-        earth_sat_y = int(earth_pos[1] + 5 * math.sin(earth_sat_angle))
+        if not self._dirty and self._text is not None:
+            return self._text
+        if self._base_chars is None:
+            self._build_background()
+        # Reset the frame buffers to the static layer in place and only draw
+        # what moves on top of it.
+        chars = self._chars
+        tags = self._tags
+        chars[:] = self._base_chars
+        tags[:] = self._base_tags
+        mars_pos, moon_pos, earth_pos = _planet_positions(self.width, self.height)
+        mars_sat, moon_sat1, moon_sat2, earth_sat = self.sat_positions
+        
+        mars_sat_buffer, moon_sat1_buffer, moon_sat2_buffer, earth_sat_buffer = self.sat_buffers
+        self._draw_satellite(chars, tags, *mars_sat, "M-S", mars_sat_buffer, False)
+        self._draw_satellite(chars, tags, *moon_sat1, "L1", moon_sat1_buffer, self.moon_sat1_is_blackhole)
+        self._draw_satellite(chars, tags, *moon_sat2, "L2", moon_sat2_buffer, False)
+        self._draw_satellite(chars, tags, *earth_sat, "E-S", earth_sat_buffer, False)
+        
+        points = (mars_pos, mars_sat, moon_sat1, moon_sat2, earth_sat, earth_pos)
+        
+        link_mask = self.link_mask
+        beam_progress = self.beam_progress
+        for link_idx, (from_idx, to_idx) in enumerate(LINK_CONNECTIONS):
+            pos1 = points[from_idx]
+            pos2 = points[to_idx]
+            
+            progress = beam_progress[link_idx]
+            if progress != BEAM_IDLE:
+                self._draw_transmission_beam(chars, tags, pos1, pos2, progress / 100.0)
+            elif link_mask >> link_idx & 1:
+                self._draw_link_line(chars, tags, pos1, pos2, True)
+        
+        self._text = self._to_text(chars, tags)
+        self._dirty = False
+        return self._text
+    
+    def _build_background(self) -> None:
+        """Draw the planets, their labels and the orbit paths, which never move."""
+        # The canvas is a flat row-major list of characters plus a parallel
+        # bytearray of style tags; cell (x, y) lives at index y * width + x.
+        size = self.width * self.height
+        chars = [' '] * size
+        tags = bytearray([TAG_PLAIN]) * size
+        
+        mars_pos, moon_pos, earth_pos = _planet_positions(self.width, self.height)
+        
+        self._draw_planet(chars, tags, mars_pos[0], mars_pos[1], "MARS", "M", 3, 5)
+        self._draw_planet(chars, tags, moon_pos[0], moon_pos[1], "MOON", "L", 2, 4)
+        self._draw_planet(chars, tags, earth_pos[0], earth_pos[1], "EARTH", "E", 3, 5)
         
         # Draw orbit paths (dotted circles)
-        self._draw_orbit_path(canvas, mars_pos[0], mars_pos[1], 10, 5)
-        self._draw_orbit_path(canvas, moon_pos[0], moon_pos[1], 8, 4)
-        self._draw_orbit_path(canvas, earth_pos[0], earth_pos[1], 10, 5)
-        
-        self._draw_satellite(canvas, mars_sat_x, mars_sat_y, "M-S", self.mars_sat_buffer, False)
-        self._draw_satellite(canvas, moon_sat1_x, moon_sat1_y, "L1", self.moon_sat1_buffer, self.moon_sat1_is_blackhole)
-        self._draw_satellite(canvas, moon_sat2_x, moon_sat2_y, "L2", self.moon_sat2_buffer, False)
-        self._draw_satellite(canvas, earth_sat_x, earth_sat_y, "E-S", self.earth_sat_buffer, False)
-        
-        sat_positions = {
-            'mars': mars_pos,
-            'mars_sat': (mars_sat_x, mars_sat_y),
-            'moon_sat1': (moon_sat1_x, moon_sat1_y),
-            'moon_sat2': (moon_sat2_x, moon_sat2_y),
-            'earth_sat': (earth_sat_x, earth_sat_y),
-            'earth': earth_pos,
-        }
-        self._sat_positions = sat_positions
-        
-        link_visible = [
-            self.link0_visible,
-            self.link1_visible,
-            self.link2_visible,
-            self.link3_visible,
-            self.link4_visible,
-            self.link5_visible,
-        ]
-        
-        link_connections = [
-            ('mars', 'mars_sat'),
-            ('mars_sat', 'moon_sat1'),
-            ('mars_sat', 'moon_sat2'),
-            ('moon_sat1', 'earth_sat'),
-            ('moon_sat2', 'earth_sat'),
-            ('earth_sat', 'earth'),
-        ]
-        
-        for link_idx, (from_key, to_key) in enumerate(link_connections):
-            pos1 = sat_positions[from_key]
-            pos2 = sat_positions[to_key]
-            
-            if self.transmitting_link == link_idx:
-                self._draw_transmission_beam(canvas, pos1, pos2, self.transmit_progress)
-            elif link_visible[link_idx]:
-                self._draw_link_line(canvas, pos1, pos2, True)
-        
-        text = Text()
-        for row in canvas:
-            line = ''.join(row)
-            colored_line = Text()
-            i = 0
-            while i < len(line):
-                char = line[i]
-                if char == 'M' and i + 3 < len(line) and line[i:i+4] == 'MARS':
-                    colored_line.append('MARS', style='bold red')
-                    i += 4
-                elif char == 'M' and i + 2 < len(line) and line[i:i+3] == 'M-S':
-                    colored_line.append('M-S', style='bold yellow')
-                    i += 3
-                elif char == 'M' and i + 2 < len(line) and line[i:i+3] == 'MOO':
-                    colored_line.append('MOON', style='bold white')
-                    i += 4
-                elif char == 'L' and i + 1 < len(line) and line[i:i+2] in ['L1', 'L2']:
-                    colored_line.append(line[i:i+2], style='bold yellow')
-                    i += 2
-                elif char == 'E' and i + 4 < len(line) and line[i:i+5] == 'EARTH':
-                    style = 'bold red' if self.earth_antenna_off else 'bold cyan'
-                    colored_line.append('EARTH', style=style)
-                    i += 5
-                elif char == 'E' and i + 2 < len(line) and line[i:i+3] == 'E-S':
-                    colored_line.append('E-S', style='bold yellow')
-                    i += 3
-                elif char == '●':
-                    colored_line.append('●', style='bold green')
-                    i += 1
-                elif char == '◉':
-                    colored_line.append('◉', style='bold green blink')
-                    i += 1
-                elif char == '═' or char == '║':
-                    colored_line.append(char, style='yellow')
-                    i += 1
-                elif char == '░':
-                    colored_line.append(char, style='dim blue')
-                    i += 1
-                elif char == '▓':
-                    colored_line.append(char, style='bold green')
-                    i += 1
-                elif char == '·':
-                    colored_line.append(char, style='dim red')
-                    i += 1
-                elif char == '-':
-                    colored_line.append(char, style='dim cyan')
-                    i += 1
-                elif char == '○':
-                    colored_line.append(char, style='dim white')
-                    i += 1
-                elif char == '✖':
-                    colored_line.append(char, style='bold red blink')
-                    i += 1
-                elif char == '[' or char == ']':
-                    colored_line.append(char, style='magenta')
-                    i += 1
-                elif char.isdigit():
-                    colored_line.append(char, style='bold magenta')
-                    i += 1
-                else:
-                    colored_line.append(char)
-                    i += 1
-            
-            text.append_text(colored_line)
-            text.append('\n')
-        
-        return text
-    
-    def _draw_planet(self, canvas, cx, cy, name, short, radius, orbit_ry):
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius * 2, radius * 2 + 1):
-                dist = math.sqrt((dx / 2) ** 2 + dy ** 2)
-                if dist <= radius:
-                    x, y = cx + dx, cy + dy
-                    if 0 <= x < self.width and 0 <= y < self.height:
-                        if dist > radius - 0.8:
-                            canvas[y][x] = '○'
-                        else:
-                            canvas[y][x] = '·'
+        self._draw_orbit_path(chars, tags, mars_pos[0], mars_pos[1], 10, 5)
+        self._draw_orbit_path(chars, tags, moon_pos[0], moon_pos[1], 8, 4)
+        self._draw_orbit_path(chars, tags, earth_pos[0], earth_pos[1], 10, 5)
+        
+        self._base_chars = chars
+        self._base_tags = tags
+        self._chars = chars.copy()
+        self._tags = tags.copy()
+    
+    def _to_text(self, chars, tags) -> Text:
+        """Turn the canvas into one Text with a span per run of equal non-plain tags."""
+        style_table = STYLE_TABLE_ANTENNA_OFF if self.earth_antenna_off else STYLE_TABLE
+        width = self.width
+        rows = []
+        spans = []
+        offset = 0
+        for row_start in range(0, len(chars), width):
+            row_end = row_start + width
+            rows.append(''.join(chars[row_start:row_end]))
+            shift = offset - row_start
+            for run in _TAG_RUN.finditer(tags, row_start, row_end):
+                start, end = run.span()
+                style = style_table[tags[start]]
+                if style:
+                    spans.append(Span(start + shift, end + shift, style))
+            offset += width + 1
+        rows.append('')
+        return Text('\n'.join(rows), spans=spans)
+    
+    def _put(self, chars, tags, x, y, char, tag):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = y * self.width + x
+            chars[i] = char
+            tags[i] = tag
+    
+    def _draw_planet(self, chars, tags, cx, cy, name, short, radius, orbit_ry):
+        for dx, dy, is_rim in _disk_cells(radius):
+            if is_rim:
+                self._put(chars, tags, cx + dx, cy + dy, '○', TAG_RIM)
+            else:
+                self._put(chars, tags, cx + dx, cy + dy, '·', TAG_DOT)
         
         label_y = cy + orbit_ry + 1
         name_start = cx - len(name) // 2
-        if 0 <= label_y < self.height:
-            for i, char in enumerate(name):
-                x = name_start + i
-                if 0 <= x < self.width:
-                    canvas[label_y][x] = char
+        tag = PLANET_TAGS[name]
+        for i, char in enumerate(name):
+            self._put(chars, tags, name_start + i, label_y, char, tag)
     
-    def _draw_orbit_path(self, canvas, cx, cy, rx, ry):
+    def _draw_orbit_path(self, chars, tags, cx, cy, rx, ry):
         """Draw a dotted orbital path."""
-        for angle in range(0, 360, 5):
-            rad = math.radians(angle)
-            x = int(cx + rx * math.cos(rad))
-            y = int(cy + ry * math.sin(rad))
+        for ox, oy in _orbit_offsets(rx, ry):
+            x = int(cx + ox)
+            y = int(cy + oy)
             if 0 <= x < self.width and 0 <= y < self.height:
-                if canvas[y][x] == ' ':
-                    canvas[y][x] = '·'
-    
-    def _draw_satellite(self, canvas, x, y, label, buffer_count, is_malicious=False):
-        if 0 <= x < self.width and 0 <= y < self.height:
-            if is_malicious:
-                canvas[y][x] = '✖'
-            elif buffer_count > 0:
-                canvas[y][x] = '◉'
-            else:
-                canvas[y][x] = '●'
+                i = y * self.width + x
+                if chars[i] == ' ':
+                    chars[i] = '·'
+                    tags[i] = TAG_DOT
+    
+    def _draw_satellite(self, chars, tags, x, y, label, buffer_count, is_malicious=False):
+        if is_malicious:
+            self._put(chars, tags, x, y, '✖', TAG_MALICIOUS)
+        elif buffer_count > 0:
+            self._put(chars, tags, x, y, '◉', TAG_SAT_BUSY)
+        else:
+            self._put(chars, tags, x, y, '●', TAG_SAT)
         
         label_start = x - len(label) // 2
-        if 0 <= y - 1 < self.height:
-            for i, char in enumerate(label):
-                lx = label_start + i
-                if 0 <= lx < self.width:
-                    canvas[y - 1][lx] = char
+        for i, char in enumerate(label):
+            self._put(chars, tags, label_start + i, y - 1, char, TAG_SAT_LABEL)
         
         buf_str = f'[{buffer_count}]'
         buf_start = x - len(buf_str) // 2
-        if 0 <= y + 1 < self.height:
-            for i, char in enumerate(buf_str):
-                lx = buf_start + i
-                if 0 <= lx < self.width:
-                    canvas[y + 1][lx] = char
+        for i, char in enumerate(buf_str):
+            tag = TAG_BUFFER_BRACKET if char in '[]' else TAG_BUFFER_COUNT
+            self._put(chars, tags, buf_start + i, y + 1, char, tag)
     
-    def _draw_link_line(self, canvas, pos1, pos2, is_connected):
-        x1, y1 = pos1
-        x2, y2 = pos2
-        
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        steps = max(dx, dy)
-        
-        if steps == 0:
-            return
+    def _draw_link_line(self, chars, tags, pos1, pos2, is_connected):
+        if is_connected:
+            char, tag = '-', TAG_LINK
+        else:
+            char, tag = '·', TAG_DOT
         
-        for i in range(0, steps + 1, 2):
-            t = i / steps
-            x = int(x1 + t * (x2 - x1))
-            y = int(y1 + t * (y2 - y1))
-            
-            if 0 <= x < self.width and 0 <= y < self.height:
-                if canvas[y][x] == ' ':
-                    if is_connected:
-                        canvas[y][x] = '-'
-                    else:
-                        canvas[y][x] = '·'
+        # Satellites revisit the same cells every orbit, so the rasterized
+        # lines between them are cached.
+        for _, idx in _line_cells(*pos1, *pos2, 2, self.width, self.height):
+            if chars[idx] == ' ':
+                chars[idx] = char
+                tags[idx] = tag
     
-    def _draw_transmission_beam(self, canvas, pos1, pos2, progress):
+    def _draw_transmission_beam(self, chars, tags, pos1, pos2, progress):
         x1, y1 = pos1
         x2, y2 = pos2
-        
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        steps = max(dx, dy)
-        
-        if steps == 0:
-            return
-        
+        steps = max(abs(x2 - x1), abs(y2 - y1))
         packet_pos = int(progress * steps)
         
-        for i in range(0, steps + 1):
-            t = i / steps
-            x = int(x1 + t * (x2 - x1))
-            y = int(y1 + t * (y2 - y1))
-            
-            if 0 <= x < self.width and 0 <= y < self.height:
-                if canvas[y][x] == ' ':
-                    if abs(i - packet_pos) <= 2:
-                        canvas[y][x] = '▓'
-                    else:
-                        canvas[y][x] = '░'
+        for i, idx in _line_cells(x1, y1, x2, y2, 1, self.width, self.height):
+            if chars[idx] == ' ':
+                if abs(i - packet_pos) <= 2:
+                    chars[idx] = '▓'
+                    tags[idx] = TAG_PACKET
+                else:
+                    chars[idx] = '░'
+                    tags[idx] = TAG_BEAM
 
 
 class SpaceScenario(Screen):
@@ -354,19 +457,49 @@ class SpaceScenario(Screen):
     
     """
     
-    is_paused: reactive[bool] = reactive(False)
-    packets_sent: reactive[int] = reactive(0)
-    packets_delivered: reactive[int] = reactive(0)
-    packets_dropped: reactive[int] = reactive(0)
-    
-    blackhole_active: reactive[bool] = reactive(False)
-    antenna_outage_active: reactive[bool] = reactive(False)
+    TICK_INTERVAL = 0.016
+    # A bundle spends this many ticks crossing a link (about 0.8s at 60Hz)
+    BEAM_TICKS = 50
+    # Mission Control is text to be read, 10Hz is plenty
+    DISPLAY_INTERVAL = 0.1
+    
+    # (source, link index, target) for every hop towards Earth
+    ROUTES = (
+        ("MA", 0, "MA-SAT"),
+        ("MA-SAT", 1, "MO-SAT1"),
+        ("MA-SAT", 2, "MO-SAT2"),
+        ("MO-SAT1", 3, "E-SAT"),
+        ("MO-SAT2", 4, "E-SAT"),
+        ("E-SAT", 5, "E"),
+    )
+    
+    # Nothing renders these directly (Mission Control polls them), so changing
+    # them mustn't repaint the whole screen.
+    is_paused: reactive[bool] = reactive(False, repaint=False)
+    packets_sent: reactive[int] = reactive(0, repaint=False)
+    packets_delivered: reactive[int] = reactive(0, repaint=False)
+    packets_dropped: reactive[int] = reactive(0, repaint=False)
+    
+    blackhole_active: reactive[bool] = reactive(False, repaint=False)
+    antenna_outage_active: reactive[bool] = reactive(False, repaint=False)
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._setup_network()
+        # Simulated time of this scenario only; it stops while paused.
+        self.clock = SimClock()
         self._orbit_phase: float = 0.0
-        self._transmitting_links: set[int] = set()
+        self._tick: int = 0
+        # link_idx -> (start tick, source id, target id, packet)
+        self._active_beams: dict[int, tuple[int, str, str, Packet]] = {}
+        # Set while running; the simulation loop waits on it while paused.
+        self._pause_event = asyncio.Event()
+        self._pause_event.set()
+        self._last_display_key = None
+        # Set whenever a buffer, a beam or a link's visibility changes; the
+        # route scan is skipped on ticks where none did, as it would find
+        # nothing new to send.
+        self._routes_dirty = True
     
     def _setup_network(self) -> None:
         self.nodes = {
@@ -379,6 +512,13 @@ class SpaceScenario(Screen):
         }
         
         self.link_visible = [True, False, False, False, False, True]
+        self._link_mask = 0b100001
+        
+        # Resolve the route table to node objects once rather than every tick
+        self._routes = [
+            (source_id, link_idx, target_id, self.nodes[source_id], self.nodes[target_id])
+            for source_id, link_idx, target_id in self.ROUTES
+        ]
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -398,89 +538,80 @@ class SpaceScenario(Screen):
         yield Footer()
     
     def on_mount(self) -> None:
+        self._orbital_view = self.query_one("#orbital-view", OrbitalView)
+        self._status_panel = self.query_one("#status-panel", Static)
+        self._blackhole_btn = self.query_one("#blackhole-btn", Button)
+        self._outage_btn = self.query_one("#outage-btn", Button)
         self._update_display()
+        self.set_interval(self.DISPLAY_INTERVAL, self._update_display)
         self.run_simulation()
     
     @work(exclusive=True)
     async def run_simulation(self) -> None:
+        # Sleep until the next deadline rather than a fixed interval, so time
+        # spent in the tick doesn't stretch the frame.
+        next_t = time.monotonic()
         while True:
-            if not self.is_paused:
-                await self._simulation_tick()
-            await asyncio.sleep(0.016)
-    
-    async def _simulation_tick(self) -> None:
+            if self.is_paused:
+                await self._pause_event.wait()
+                next_t = time.monotonic()
+                continue
+            self._simulation_tick()
+            next_t += self.TICK_INTERVAL
+            delay = next_t - time.monotonic()
+            if delay < 0:
+                # Fell behind; don't try to catch up with a burst of ticks.
+                next_t -= delay
+                delay = 0
+            await asyncio.sleep(delay)
+    
+    def _simulation_tick(self) -> None:
+        self._tick += 1
         self._orbit_phase += 0.002
+        self.clock.advance(self.TICK_INTERVAL)
         
-        mars_sat_angle = self._orbit_phase * 1.5
-        moon_sat1_angle = self._orbit_phase * 2.0
-        moon_sat2_angle = self._orbit_phase * 2.0 + math.pi
-        earth_sat_angle = self._orbit_phase * 1.8 + 0.5
-        
-        self.link_visible[0] = math.cos(mars_sat_angle) > 0.2
-        
-        mars_sat_facing_moon = math.cos(mars_sat_angle) > 0.3
-        moon_sat1_facing_mars = math.cos(moon_sat1_angle) < -0.2
-        self.link_visible[1] = mars_sat_facing_moon and moon_sat1_facing_mars
-        
-        moon_sat2_facing_mars = math.cos(moon_sat2_angle) < -0.2
-        self.link_visible[2] = mars_sat_facing_moon and moon_sat2_facing_mars
-        
-        moon_sat1_facing_earth = math.cos(moon_sat1_angle) > 0.3
-        earth_sat_facing_moon = math.cos(earth_sat_angle) < -0.2
-        self.link_visible[3] = moon_sat1_facing_earth and earth_sat_facing_moon
-        
-        moon_sat2_facing_earth = math.cos(moon_sat2_angle) > 0.3
-        self.link_visible[4] = moon_sat2_facing_earth and earth_sat_facing_moon
-        
+        link_mask = _visibility_mask(self._orbit_phase)
         if self.antenna_outage_active:
-            self.link_visible[5] = False
-        else:
-            self.link_visible[5] = math.cos(earth_sat_angle) < 0.2
-        
-        try:
-            orbital_view = self.query_one("#orbital-view", OrbitalView)
-            orbital_view.orbit_phase = self._orbit_phase
-            
-            orbital_view.mars_sat_buffer = self.nodes["MA-SAT"].buffer_size
-            orbital_view.moon_sat1_buffer = self.nodes["MO-SAT1"].buffer_size
-            orbital_view.moon_sat2_buffer = self.nodes["MO-SAT2"].buffer_size
-            orbital_view.earth_sat_buffer = self.nodes["E-SAT"].buffer_size
-            
-            orbital_view.moon_sat1_is_blackhole = self.blackhole_active
-            orbital_view.earth_antenna_off = self.antenna_outage_active
-            
-            orbital_view.link0_visible = self.link_visible[0]
-            orbital_view.link1_visible = self.link_visible[1]
-            orbital_view.link2_visible = self.link_visible[2]
-            orbital_view.link3_visible = self.link_visible[3]
-            orbital_view.link4_visible = self.link_visible[4]
-            orbital_view.link5_visible = self.link_visible[5]
-        except Exception:
-            pass
-        
-        await self._process_all_transmissions()
-        
-        self._update_display()
-    
-    async def _process_all_transmissions(self) -> None:
-        routes = [
-            ("MA", 0, "MA-SAT", self.link_visible[0]),
-            ("MA-SAT", 1, "MO-SAT1", self.link_visible[1]),
-            ("MA-SAT", 2, "MO-SAT2", self.link_visible[2]),
-            ("MO-SAT1", 3, "E-SAT", self.link_visible[3]),
-            ("MO-SAT2", 4, "E-SAT", self.link_visible[4]),
-            ("E-SAT", 5, "E", self.link_visible[5]),
-        ]
-        
-        for source_id, link_idx, target_id, is_visible in routes:
-            if not is_visible or link_idx in self._transmitting_links:
+            link_mask &= ~(1 << 5)
+        if link_mask != self._link_mask:
+            self._link_mask = link_mask
+            self.link_visible = [bool(link_mask >> i & 1) for i in range(6)]
+            self._routes_dirty = True
+        
+        self._advance_beams()
+        if self._routes_dirty:
+            self._routes_dirty = False
+            self._process_all_transmissions()
+        
+        sat_buffers = (
+            self.nodes["MA-SAT"].buffer_size,
+            self.nodes["MO-SAT1"].buffer_size,
+            self.nodes["MO-SAT2"].buffer_size,
+            self.nodes["E-SAT"].buffer_size,
+        )
+        
+        progress = [BEAM_IDLE] * 6
+        for link_idx, (start_tick, _, _, _) in self._active_beams.items():
+            progress[link_idx] = (self._tick - start_tick) * 100 // self.BEAM_TICKS
+        
+        orbital_view = self._orbital_view
+        sat_positions = _satellite_positions(self._orbit_phase, orbital_view.width, orbital_view.height)
+        with self.app.batch_update():
+            orbital_view.sat_positions = sat_positions
+            orbital_view.sat_buffers = sat_buffers
+            orbital_view.link_mask = link_mask
+            orbital_view.beam_progress = bytes(progress)
+    
+    def _process_all_transmissions(self) -> None:
+        link_visible = self.link_visible
+        
+        for source_id, link_idx, target_id, source_node, target_node in self._routes:
+            if not link_visible[link_idx] or link_idx in self._active_beams:
                 continue
             
-            source_node = self.nodes[source_id]
             if source_node.buffer_size == 0:
                 continue
             
-            target_node = self.nodes[target_id]
             if target_id != "E" and target_node.buffer.is_full:
                 continue
             
@@ -489,80 +620,86 @@ class SpaceScenario(Screen):
                 continue
             
             self._animate_transmission(link_idx, source_id, target_id, packet)
+            # The source now has room for the hop behind it
+            self._routes_dirty = True
     
-    @work(exclusive=False)
-    async def _animate_transmission(self, link_idx: int, source_id: str, target_id: str, packet: Packet) -> None:
-        self._transmitting_links.add(link_idx)
-        
-        try:
-            orbital_view = self.query_one("#orbital-view", OrbitalView)
-            orbital_view.transmitting_link = link_idx
-            
-            for progress in range(0, 101, 2):
-                orbital_view.transmit_progress = progress / 100.0
-                await asyncio.sleep(0.015)
+    def _animate_transmission(self, link_idx: int, source_id: str, target_id: str, packet: Packet) -> None:
+        self._active_beams[link_idx] = (self._tick, source_id, target_id, packet)
+    
+    def _advance_beams(self) -> None:
+        finished = [
+            link_idx
+            for link_idx, (start_tick, _, _, _) in self._active_beams.items()
+            if self._tick - start_tick >= self.BEAM_TICKS
+        ]
+        for link_idx in finished:
+            _, _, target_id, packet = self._active_beams.pop(link_idx)
+            target_node = self.nodes[target_id]
             
-            orbital_view.transmitting_link = -1
-            orbital_view.transmit_progress = 0.0
-        except Exception:
-            await asyncio.sleep(0.5)
-        
-        target_node = self.nodes[target_id]
-        
-        if target_id == "MO-SAT1" and self.blackhole_active:
-            self.packets_dropped += 1
-        elif target_id == "E":
-            self.packets_delivered += 1
-        else:
-            target_node.queue_packet(packet)
-        
-        self._transmitting_links.discard(link_idx)
+            if target_id == "MO-SAT1" and self.blackhole_active:
+                self.packets_dropped += 1
+                Packet.release(packet)
+            elif target_id == "E":
+                self.packets_delivered += 1
+                Packet.release(packet)
+            elif not target_node.queue_packet(packet):
+                Packet.release(packet)
+            self._routes_dirty = True
     
     def _update_display(self) -> None:
-        try:
-            status = self.query_one("#status-panel", Static)
-            
-            table = Table.grid(padding=(0, 2))
-            table.add_column(justify="left")
-            table.add_column(justify="center")
-            table.add_column(justify="center")
-            table.add_column(justify="right")
-            
-            mars_l1 = "🟢 VISIBLE" if self.link_visible[1] else "🔴 BLOCKED"
-            mars_l2 = "🟢 VISIBLE" if self.link_visible[2] else "🔴 BLOCKED"
-            l1_earth = "🟢 VISIBLE" if self.link_visible[3] else "🔴 BLOCKED"
-            l2_earth = "🟢 VISIBLE" if self.link_visible[4] else "🔴 BLOCKED"
-            
-            table.add_row(
-                Text(f"Sent: {self.packets_sent}", style="cyan"),
-                Text(f"M-SAT→L1: {mars_l1}", style="white"),
-                Text(f"M-SAT→L2: {mars_l2}", style="white"),
-                Text(f"Delivered: {self.packets_delivered} | Dropped: {self.packets_dropped}", style="green bold"),
-            )
-            
-            table.add_row(
-                Text("", style=""),
-                Text(f"L1→E-SAT: {l1_earth}", style="white"),
-                Text(f"L2→E-SAT: {l2_earth}", style="white"),
-                Text("", style=""),
-            )
-            
-            total_buffered = sum(node.buffer_size for node in self.nodes.values())
-            state = "PAUSED" if self.is_paused else ("TRANSMITTING" if len(self._transmitting_links) > 0 else "ACTIVE")
-            
-            mars_status = f"Mars: {self.nodes['MA'].buffer_size}/5"
-            mars_sat_status = f"M-SAT: {self.nodes['MA-SAT'].buffer_size}/5"
-            
-            table.add_row(
-                Text(mars_status, style="yellow"),
-                Text(mars_sat_status, style="yellow"),
-                Text(f"Total Buffered: {total_buffered}", style="yellow"),
-                Text(f"State: {state}", style="magenta bold"),
-            )
-            
-            status.update(Panel(table, title="📡 Mission Control", border_style="blue"))
-        except Exception:
-            pass
+        total_buffered = sum(node.buffer_size for node in self.nodes.values())
+        state = "PAUSED" if self.is_paused else ("TRANSMITTING" if self._active_beams else "ACTIVE")
+        
+        key = (
+            self.packets_sent,
+            self.packets_delivered,
+            self.packets_dropped,
+            tuple(self.link_visible[1:5]),
+            self.nodes["MA"].buffer_size,
+            self.nodes["MA-SAT"].buffer_size,
+            total_buffered,
+            state,
+        )
+        if key == self._last_display_key:
+            return
+        self._last_display_key = key
+        
+        table = Table.grid(padding=(0, 2))
+        table.add_column(justify="left")
+        table.add_column(justify="center")
+        table.add_column(justify="center")
+        table.add_column(justify="right")
+        
+        mars_l1 = "🟢 VISIBLE" if self.link_visible[1] else "🔴 BLOCKED"
+        mars_l2 = "🟢 VISIBLE" if self.link_visible[2] else "🔴 BLOCKED"
+        l1_earth = "🟢 VISIBLE" if self.link_visible[3] else "🔴 BLOCKED"
+        l2_earth = "🟢 VISIBLE" if self.link_visible[4] else "🔴 BLOCKED"
+        
+        table.add_row(
+            Text(f"Sent: {self.packets_sent}", style="cyan"),
+            Text(f"M-SAT→L1: {mars_l1}", style="white"),
+            Text(f"M-SAT→L2: {mars_l2}", style="white"),
+            Text(f"Delivered: {self.packets_delivered} | Dropped: {self.packets_dropped}", style="green bold"),
+        )
+        
+        table.add_row(
+            Text("", style=""),
+            Text(f"L1→E-SAT: {l1_earth}", style="white"),
+            Text(f"L2→E-SAT: {l2_earth}", style="white"),
+            Text("", style=""),
+        )
+        
+        mars_status = f"Mars: {self.nodes['MA'].buffer_size}/5"
+        mars_sat_status = f"M-SAT: {self.nodes['MA-SAT'].buffer_size}/5"
+        
+        table.add_row(
+            Text(mars_status, style="yellow"),
+            Text(mars_sat_status, style="yellow"),
+            Text(f"Total Buffered: {total_buffered}", style="yellow"),
+            Text(f"State: {state}", style="magenta bold"),
+        )
+        
+        self._status_panel.update(Panel(table, title="📡 Mission Control", border_style="blue"))
         
 
     
@@ -571,12 +708,19 @@ class SpaceScenario(Screen):
     def action_send_packet(self) -> None:
         mars_node = self.nodes["MA"]
         if not mars_node.buffer.is_full:
-            packet = Packet("MA", "E", PacketType.NORMAL, f"Data-{self.packets_sent}")
+            packet = Packet.acquire("MA", "E", payload=f"Data-{self.packets_sent}", clock=self.clock)
             if mars_node.queue_packet(packet):
                 self.packets_sent += 1
+                self._routes_dirty = True
+            else:
+                Packet.release(packet)
     
     def action_toggle_pause(self) -> None:
         self.is_paused = not self.is_paused
+        if self.is_paused:
+            self._pause_event.clear()
+        else:
+            self._pause_event.set()
     
     def action_go_back(self) -> None:
         self.app.pop_screen()
@@ -594,38 +738,39 @@ class SpaceScenario(Screen):
     def toggle_blackhole_attack(self) -> None:
         self.blackhole_active = not self.blackhole_active
         
-        try:
-            btn = self.query_one("#blackhole-btn", Button)
-            if self.blackhole_active:
-                btn.label = "Blackhole: ON"
-                self.nodes["MO-SAT1"].buffer.clear()
-            else:
-                btn.label = "Blackhole Attack"
-            btn.refresh()
-        except Exception:
-            pass
+        self._orbital_view.moon_sat1_is_blackhole = self.blackhole_active
+        
+        btn = self._blackhole_btn
+        if self.blackhole_active:
+            btn.label = "Blackhole: ON"
+            self.nodes["MO-SAT1"].buffer.clear()
+            self._routes_dirty = True
+        else:
+            btn.label = "Blackhole Attack"
+        btn.refresh()
     
     def trigger_resource_exhaustion(self) -> None:
         l1_node = self.nodes["MO-SAT1"]
         l2_node = self.nodes["MO-SAT2"]
         
         if not l1_node.buffer.is_full:
-            spam_packet = Packet("ATTACKER", "SPAM", PacketType.NORMAL, "spam")
+            spam_packet = Packet.acquire("ATTACKER", "SPAM", payload="spam", clock=self.clock)
             l1_node.queue_packet(spam_packet)
         
         if not l2_node.buffer.is_full:
-            spam_packet = Packet("ATTACKER", "SPAM", PacketType.NORMAL, "spam")
+            spam_packet = Packet.acquire("ATTACKER", "SPAM", payload="spam", clock=self.clock)
             l2_node.queue_packet(spam_packet)
+        
+        self._routes_dirty = True
     
     def toggle_antenna_outage(self) -> None:
         self.antenna_outage_active = not self.antenna_outage_active
         
-        try:
-            btn = self.query_one("#outage-btn", Button)
-            if self.antenna_outage_active:
-                btn.label = "Earth antenna: OFF"
-            else:
-                btn.label = "Earth antenna: ON"
-            btn.refresh()
-        except Exception:
-            pass
+        self._orbital_view.earth_antenna_off = self.antenna_outage_active
+        
+        btn = self._outage_btn
+        if self.antenna_outage_active:
+            btn.label = "Earth antenna: OFF"
+        else:
+            btn.label = "Earth antenna: ON"
+        btn.refresh()